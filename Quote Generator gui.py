@@ -4,9 +4,39 @@ import random
 import datetime
 import json
 import os
+import re
+import math
+import heapq
+import time
+import cProfile
+import pstats
 from PIL import Image, ImageTk
 import requests
-from io import BytesIO
+from io import BytesIO, StringIO
+from collections import Counter
+from quote_schedule import (QUOTES_FILE, QuoteSchedule, get_mtime, is_valid_quote,
+                            is_valid_quotes, read_quotes)
+
+# Runtime metrics are off unless QUOTE_METRICS=1 is set
+METRICS_ENABLED = os.environ.get("QUOTE_METRICS") == "1"
+METRICS_FILE = "metrics.json"
+METRICS_INTERVAL = 60000  # milliseconds between metric dumps
+LATENCY_BUCKETS = [1, 5, 10, 50, 100, 500, 1000]  # milliseconds
+PROFILE_FILE = "profile.txt"
+
+# Recommendations pick at random among this many best matches
+RECOMMEND_TOP_K = 5
+
+# Common words left out of recommendation features
+STOPWORDS = {
+    'about', 'all', 'also', 'and', 'any', 'are', 'but', 'can', 'could',
+    'did', 'does', "don't", 'for', 'from', 'had', 'has', 'have', 'her',
+    'his', 'how', 'its', "it's", "i've", 'just', 'not', 'now', 'only',
+    'our', 'out', 'she', 'should', 'than', 'that', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'those', 'too', 'very', 'was',
+    'were', 'what', 'whatever', 'when', 'which', 'while', 'who', 'whoever',
+    'will', 'with', 'within', "won't", 'would', 'you', "you're", 'your'
+}
 
 class DailyQuoteGenerator:
     def __init__(self, root):
@@ -23,16 +53,36 @@ class DailyQuoteGenerator:
         self.current_quote = None
         self.favorite_quotes = []
         
+        # Runtime metrics and optional profiler
+        self.metrics_enabled = METRICS_ENABLED
+        self.metrics = {'counters': {}, 'timings': {}}
+        self.metrics_job = None
+        self.profiler = None
+        
         # Initialize quote collections
+        started = self.start_timer()
         self.quotes = self.load_quotes()
+        self.record_metric('quote_load', started)
+        self.quotes_by_text = {q['quote']: q for q in self.quotes}
+        self.quotes_mtime = get_mtime(QUOTES_FILE)
+        self.favorites_profile = {}
+        self.build_feature_index()
+        
+        # Daily quote schedule
+        self.schedule = QuoteSchedule(on_error=self.update_status)
         
         # Set up the GUI
         self.setup_styles()
         self.create_widgets()
         self.load_favorites()
+        self.rebuild_favorites_profile()
         
         # Load today's quote automatically
         self.get_todays_quote()
+        
+        # Periodically dump metrics when enabled
+        if self.metrics_enabled:
+            self.metrics_job = self.root.after(METRICS_INTERVAL, self.schedule_metrics_dump)
     
     def setup_styles(self):
         """Configure ttk styles"""
@@ -84,7 +134,6 @@ class DailyQuoteGenerator:
     
     def load_quotes(self):
         """Load quotes from JSON file or use default"""
-        quotes_file = "quotes.json"
         default_quotes = [
             {"quote": "The only way to do great work is to love what you do.", "author": "Steve Jobs", "category": "Inspiration"},
             {"quote": "Life is what happens to you while you're busy making other plans.", "author": "John Lennon", "category": "Life"},
@@ -109,12 +158,13 @@ class DailyQuoteGenerator:
         ]
         
         try:
-            if os.path.exists(quotes_file):
-                with open(quotes_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if os.path.exists(QUOTES_FILE):
+                with open(QUOTES_FILE, 'r', encoding='utf-8') as f:
+                    quotes = json.load(f)
+                return quotes if is_valid_quotes(quotes) else default_quotes
             else:
                 # Create the file with default quotes
-                with open(quotes_file, 'w', encoding='utf-8') as f:
+                with open(QUOTES_FILE, 'w', encoding='utf-8') as f:
                     json.dump(default_quotes, f, indent=2)
                 return default_quotes
         except Exception:
@@ -217,6 +267,11 @@ class DailyQuoteGenerator:
                   style='Accent.TButton',
                   command=self.get_next_quote).pack(side=tk.LEFT, padx=5)
         
+        ttk.Button(top_button_frame,
+                  text="Like My Favorites",
+                  style='Accent.TButton',
+                  command=self.get_recommended_quote).pack(side=tk.LEFT, padx=5)
+        
         # Bottom row of buttons
         bottom_button_frame = tk.Frame(button_frame, bg=self.colors['bg'])
         bottom_button_frame.pack()
@@ -276,37 +331,295 @@ class DailyQuoteGenerator:
         fav_count = len(self.favorite_quotes)
         self.counter_label.config(text=f"Quotes: {total} | Favorites: {fav_count}")
     
+    def start_timer(self):
+        """Return a start time, or None when metrics are disabled"""
+        if not self.metrics_enabled:
+            return None
+        return time.perf_counter()
+    
+    def record_metric(self, name, started=None):
+        """Count an event and add its latency to the histogram"""
+        if not self.metrics_enabled:
+            return
+        
+        counters = self.metrics['counters']
+        counters[name] = counters.get(name, 0) + 1
+        
+        if started is None:
+            return
+        
+        elapsed = (time.perf_counter() - started) * 1000
+        timing = self.metrics['timings'].get(name)
+        if timing is None:
+            timing = {'count': 0, 'sum': 0.0, 'buckets': [0] * len(LATENCY_BUCKETS)}
+            self.metrics['timings'][name] = timing
+        
+        timing['count'] += 1
+        timing['sum'] += elapsed
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if elapsed <= bound:
+                timing['buckets'][i] += 1
+    
+    def get_metrics_snapshot(self):
+        """Return counters, timings and collection sizes as a dict"""
+        return {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'counters': dict(self.metrics['counters']),
+            'timings': {name: dict(timing, buckets=list(timing['buckets']))
+                        for name, timing in self.metrics['timings'].items()},
+            'quotes': len(self.quotes),
+            'favorites': len(self.favorite_quotes)
+        }
+    
+    def format_metrics_text(self):
+        """Format metrics in the Prometheus text exposition format"""
+        lines = [
+            "# TYPE quote_events_total counter"
+        ]
+        for name, count in sorted(self.metrics['counters'].items()):
+            lines.append(f'quote_events_total{{event="{name}"}} {count}')
+        
+        lines.append("# TYPE quote_latency_ms histogram")
+        for name, timing in sorted(self.metrics['timings'].items()):
+            for bound, count in zip(LATENCY_BUCKETS, timing['buckets']):
+                lines.append(f'quote_latency_ms_bucket{{event="{name}",le="{bound}"}} {count}')
+            lines.append(f'quote_latency_ms_bucket{{event="{name}",le="+Inf"}} {timing["count"]}')
+            lines.append(f'quote_latency_ms_sum{{event="{name}"}} {timing["sum"]:.3f}')
+            lines.append(f'quote_latency_ms_count{{event="{name}"}} {timing["count"]}')
+        
+        lines.append("# TYPE quote_corpus_size gauge")
+        lines.append(f"quote_corpus_size {len(self.quotes)}")
+        lines.append("# TYPE quote_favorites_size gauge")
+        lines.append(f"quote_favorites_size {len(self.favorite_quotes)}")
+        return "\n".join(lines) + "\n"
+    
+    def dump_metrics(self):
+        """Write a JSON snapshot of the metrics to a file"""
+        try:
+            with open(METRICS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.get_metrics_snapshot(), f, indent=2)
+        except Exception:
+            pass
+    
+    def schedule_metrics_dump(self):
+        """Dump metrics and schedule the next dump"""
+        self.dump_metrics()
+        self.metrics_job = self.root.after(METRICS_INTERVAL, self.schedule_metrics_dump)
+    
+    def toggle_metrics(self):
+        """Turn metrics collection on or off"""
+        self.metrics_enabled = not self.metrics_enabled
+        if self.metrics_enabled:
+            self.metrics_job = self.root.after(METRICS_INTERVAL, self.schedule_metrics_dump)
+            self.update_status("Metrics enabled")
+        else:
+            if self.metrics_job is not None:
+                self.root.after_cancel(self.metrics_job)
+                self.metrics_job = None
+            self.dump_metrics()
+            self.update_status("Metrics disabled")
+    
+    def toggle_profiler(self):
+        """Start the profiler, or stop it and write its stats to a file"""
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+            self.update_status("Profiler started")
+            return
+        
+        self.profiler.disable()
+        output = StringIO()
+        stats = pstats.Stats(self.profiler, stream=output)
+        stats.sort_stats('cumulative').print_stats(30)
+        self.profiler = None
+        
+        try:
+            with open(PROFILE_FILE, 'w', encoding='utf-8') as f:
+                f.write(output.getvalue())
+            self.update_status(f"Profile saved to {PROFILE_FILE}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save profile: {e}")
+    
+    def view_metrics(self):
+        """Open a new window showing the current metrics"""
+        if not self.metrics_enabled and not self.metrics['counters']:
+            messagebox.showinfo("No Metrics", "Metrics are disabled. Enable them from the Tools menu.")
+            return
+        
+        metrics_window = tk.Toplevel(self.root)
+        metrics_window.title("Metrics")
+        metrics_window.geometry("700x500")
+        metrics_window.configure(bg=self.colors['bg'])
+        
+        text_area = scrolledtext.ScrolledText(metrics_window,
+                                             wrap=tk.NONE,
+                                             font=('Courier', 10),
+                                             width=80,
+                                             height=20)
+        text_area.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
+        text_area.insert(tk.END, self.format_metrics_text())
+        text_area.config(state=tk.DISABLED)
+        
+        close_btn = ttk.Button(metrics_window,
+                              text="Close",
+                              style='Accent.TButton',
+                              command=metrics_window.destroy)
+        close_btn.pack(pady=10)
+    
+    def reload_quotes_if_changed(self):
+        """Reload quotes when the quote file changes on disk"""
+        mtime = get_mtime(QUOTES_FILE)
+        if mtime is None or mtime == self.quotes_mtime:
+            return
+        
+        # Keep the current quotes if the file is mid-write or malformed
+        started = self.start_timer()
+        quotes = read_quotes(QUOTES_FILE)
+        if quotes is None:
+            return
+        
+        self.quotes = quotes
+        self.quotes_by_text = {q['quote']: q for q in quotes}
+        self.quotes_mtime = mtime
+        self.build_feature_index()
+        self.rebuild_favorites_profile()
+        self.record_metric('quote_reload', started)
+        self.update_counter()
+    
     def get_todays_quote(self):
-        """Get quote based on today's date"""
+        """Get today's quote from the daily schedule"""
+        self.reload_quotes_if_changed()
+        started = self.start_timer()
         today = datetime.date.today()
-        seed = today.toordinal()
-        random.seed(seed)
+        text = self.schedule.get_text(self.quotes_by_text, today)
+        self.current_quote = self.quotes_by_text[text]
+        self.record_metric('select_today', started)
         
-        self.current_quote = random.choice(self.quotes)
+        # Show the schedule day the quote was looked up for
+        self.date_label.config(text=today.strftime('%A, %B %d, %Y'))
         self.display_quote(self.current_quote)
         self.update_status("Today's quote loaded")
     
     def get_random_quote(self):
         """Get a completely random quote"""
+        self.reload_quotes_if_changed()
         random.seed()
+        started = self.start_timer()
         self.current_quote = random.choice(self.quotes)
+        self.record_metric('select_random', started)
         self.display_quote(self.current_quote)
         self.update_status("Random quote loaded")
     
     def get_next_quote(self):
         """Get the next quote in sequence"""
-        if not self.current_quote:
+        self.reload_quotes_if_changed()
+        if not self.current_quote or self.current_quote not in self.quotes:
             self.get_random_quote()
             return
         
+        started = self.start_timer()
         current_index = self.quotes.index(self.current_quote)
         next_index = (current_index + 1) % len(self.quotes)
         self.current_quote = self.quotes[next_index]
+        self.record_metric('select_next', started)
         self.display_quote(self.current_quote)
         self.update_status("Next quote loaded")
     
+    def quote_features(self, quote):
+        """Return the words, author and category of a quote as features"""
+        features = [word for word in re.findall(r"[a-z']+", quote['quote'].lower())
+                    if len(word) > 2 and word not in STOPWORDS]
+        features.append(f"author:{quote['author'].lower()}")
+        if 'category' in quote:
+            features.append(f"category:{quote['category'].lower()}")
+        return features
+    
+    def weigh_features(self, counts):
+        """Turn feature counts into a unit-length TF-IDF vector"""
+        vector = {term: n * self.idf[term] for term, n in counts.items() if term in self.idf}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {term: weight / norm for term, weight in vector.items()}
+    
+    def build_feature_index(self):
+        """Precompute TF-IDF weights and an inverted index over the quotes"""
+        counts = [Counter(self.quote_features(q)) for q in self.quotes]
+        doc_freq = Counter()
+        for quote_counts in counts:
+            doc_freq.update(quote_counts.keys())
+        
+        total = len(self.quotes)
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1
+                    for term, df in doc_freq.items()}
+        
+        # Map each feature to the quotes that have it, so scoring only
+        # visits quotes sharing at least one feature with the favorites
+        self.postings = {}
+        for i, quote_counts in enumerate(counts):
+            for term, weight in self.weigh_features(quote_counts).items():
+                self.postings.setdefault(term, []).append((i, weight))
+    
+    def update_favorites_profile(self, quote, sign):
+        """Add (sign=1) or remove (sign=-1) a quote's vector from the profile"""
+        vector = self.weigh_features(Counter(self.quote_features(quote)))
+        for term, weight in vector.items():
+            value = self.favorites_profile.get(term, 0.0) + sign * weight
+            if abs(value) < 1e-9:
+                self.favorites_profile.pop(term, None)
+            else:
+                self.favorites_profile[term] = value
+    
+    def rebuild_favorites_profile(self):
+        """Recompute the favorites profile from scratch"""
+        self.favorites_profile = {}
+        for quote in self.favorite_quotes:
+            self.update_favorites_profile(quote, 1)
+    
+    def get_recommended_quote(self):
+        """Get a quote similar to the favorite quotes"""
+        self.reload_quotes_if_changed()
+        if not self.favorite_quotes:
+            messagebox.showinfo("No Favorites", "Add some quotes to favorites to get recommendations!")
+            return
+        
+        started = self.start_timer()
+        scores = {}
+        for term, weight in self.favorites_profile.items():
+            for i, quote_weight in self.postings.get(term, ()):
+                scores[i] = scores.get(i, 0.0) + weight * quote_weight
+        
+        # Skip quotes that are already favorites or currently shown
+        favorite_texts = {q['quote'] for q in self.favorite_quotes}
+        if self.current_quote:
+            favorite_texts.add(self.current_quote['quote'])
+        candidates = [(score, i) for i, score in scores.items()
+                      if self.quotes[i]['quote'] not in favorite_texts]
+        
+        top = heapq.nlargest(RECOMMEND_TOP_K, candidates)
+        if top:
+            self.current_quote = self.quotes[random.choice(top)[1]]
+            status = "Recommended quote loaded"
+        else:
+            # Nothing shares a word, author or category with the favorites
+            others = [q for q in self.quotes if q['quote'] not in favorite_texts]
+            if not others:
+                messagebox.showinfo("No Recommendations", "There are no other quotes to recommend!")
+                return
+            self.current_quote = random.choice(others)
+            status = "No similar quotes found, showing a random one"
+        
+        self.record_metric('select_recommended', started)
+        self.display_quote(self.current_quote)
+        self.update_status(status)
+    
     def display_quote(self, quote_data):
         """Display the quote in the text widget"""
+        started = self.start_timer()
+        
+        # Re-enable editing so the previous quote can be replaced
+        self.quote_text.config(state=tk.NORMAL)
+        
         # Clear the text widget
         self.quote_text.delete(1.0, tk.END)
         
@@ -328,6 +641,7 @@ class DailyQuoteGenerator:
         
         # Disable editing
         self.quote_text.config(state=tk.DISABLED)
+        self.record_metric('display', started)
     
     def update_favorite_button(self):
         """Update the favorite button text based on current quote status"""
@@ -347,9 +661,11 @@ class DailyQuoteGenerator:
         
         if self.current_quote in self.favorite_quotes:
             self.favorite_quotes.remove(self.current_quote)
+            self.update_favorites_profile(self.current_quote, -1)
             self.update_status("Removed from favorites")
         else:
             self.favorite_quotes.append(self.current_quote)
+            self.update_favorites_profile(self.current_quote, 1)
             self.update_status("Added to favorites")
         
         self.save_favorites()
@@ -358,18 +674,25 @@ class DailyQuoteGenerator:
     
     def save_favorites(self):
         """Save favorites to a file"""
+        started = self.start_timer()
         try:
             with open('favorites.json', 'w', encoding='utf-8') as f:
                 json.dump(self.favorite_quotes, f, indent=2)
+            self.record_metric('favorites_save', started)
         except Exception as e:
             messagebox.showerror("Error", f"Could not save favorites: {e}")
     
     def load_favorites(self):
-        """Load favorites from a file"""
+        """Load favorites from a file, skipping entries that are not quotes"""
+        started = self.start_timer()
         try:
             if os.path.exists('favorites.json'):
                 with open('favorites.json', 'r', encoding='utf-8') as f:
-                    self.favorite_quotes = json.load(f)
+                    favorites = json.load(f)
+                if not isinstance(favorites, list):
+                    favorites = []
+                self.favorite_quotes = [q for q in favorites if is_valid_quote(q)]
+            self.record_metric('favorites_load', started)
         except Exception:
             self.favorite_quotes = []
     
@@ -379,6 +702,7 @@ class DailyQuoteGenerator:
             messagebox.showwarning("No Quote", "No quote to save!")
             return
         
+        started = self.start_timer()
         try:
             today = datetime.date.today()
             filename = f"quote_{today.strftime('%Y%m%d')}.txt"
@@ -391,6 +715,7 @@ class DailyQuoteGenerator:
                 if 'category' in self.current_quote:
                     f.write(f"Category: {self.current_quote['category']}\n")
             
+            self.record_metric('file_save', started)
             self.update_status(f"Quote saved to {filename}")
             messagebox.showinfo("Success", f"Quote saved to {filename}")
         except Exception as e:
@@ -462,6 +787,7 @@ class DailyQuoteGenerator:
             "• Get today's quote\n"
             "• Random quotes\n"
             "• Save favorites\n"
+            "• Quotes like your favorites\n"
             "• Copy to clipboard\n\n"
             "© 2023 Daily Quote Generator"
         )
@@ -489,6 +815,14 @@ def main():
     quote_menu.add_command(label="Today's Quote", command=app.get_todays_quote)
     quote_menu.add_command(label="Random Quote", command=app.get_random_quote)
     quote_menu.add_command(label="Next Quote", command=app.get_next_quote)
+    quote_menu.add_command(label="Like My Favorites", command=app.get_recommended_quote)
+    
+    # Tools menu
+    tools_menu = tk.Menu(menubar, tearoff=0)
+    menubar.add_cascade(label="Tools", menu=tools_menu)
+    tools_menu.add_command(label="View Metrics", command=app.view_metrics)
+    tools_menu.add_command(label="Toggle Metrics", command=app.toggle_metrics)
+    tools_menu.add_command(label="Toggle Profiler", command=app.toggle_profiler)
     
     # Help menu
     help_menu = tk.Menu(menubar, tearoff=0)
@@ -3,6 +3,7 @@ import datetime
 import time
 import sys
 import os
+from quote_schedule import QUOTES_FILE, QuoteSchedule, get_mtime, read_quotes
 
 # Collection of inspirational quotes
 QUOTES = [
@@ -28,6 +29,35 @@ QUOTES = [
     {"quote": "I have not failed. I've just found 10,000 ways that won't work.", "author": "Thomas Edison"}
 ]
 
+# Quotes from the shared quote file; QUOTES is used until it first appears
+_quotes = QUOTES
+_quotes_by_text = {q["quote"]: q for q in QUOTES}  # what the schedule stores
+_quotes_mtime = None
+_schedule = None
+
+def get_quotes():
+    """
+    Return the current quotes, reloading them when the quote file changes.
+    Edits to the shared file are picked up without restarting the program.
+    If the file is missing, cannot be read (e.g. it is mid-write) or does
+    not hold a list of quotes, the last valid quotes are kept, as the GUI
+    does, and the reload is retried on the next call.
+    """
+    global _quotes, _quotes_by_text, _quotes_mtime
+    
+    mtime = get_mtime(QUOTES_FILE)
+    if mtime is None or mtime == _quotes_mtime:
+        return _quotes
+    
+    quotes = read_quotes(QUOTES_FILE)
+    if quotes is None:
+        return _quotes
+    
+    _quotes = quotes
+    _quotes_by_text = {q["quote"]: q for q in quotes}
+    _quotes_mtime = mtime
+    return _quotes
+
 def display_header():
     """Display a header with the current date"""
     today = datetime.date.today()
@@ -37,28 +67,39 @@ def display_header():
     print(f"Date: {today.strftime('%A, %B %d, %Y')}")
     print("-" * 60)
 
+def get_scheduled_quote():
+    """Look up today's quote in the daily schedule. Returns the day and its quote."""
+    global _schedule
+    if _schedule is None:
+        _schedule = QuoteSchedule()
+    
+    get_quotes()
+    today = datetime.date.today()
+    text = _schedule.get_text(_quotes_by_text, today)
+    return today, _quotes_by_text[text]
+
 def get_daily_quote(seed=None):
     """
     Get a quote for today. If seed is provided, use it for deterministic
-    daily selection. Otherwise, pick a random quote.
+    selection. Otherwise, look up today's quote in the daily schedule.
     """
     if seed is None:
-        # Use today's date as a seed for daily consistency
-        today = datetime.date.today()
-        seed = today.toordinal()  # Convert date to integer
+        return get_scheduled_quote()[1]
     
     # Set the seed for reproducibility
     random.seed(seed)
     
     # Select and return a quote
-    return random.choice(QUOTES)
+    return random.choice(get_quotes())
 
-def display_quote(quote_data):
-    """Display the quote in a nice format"""
+def display_quote(quote_data, day=None):
+    """Display the quote in a nice format, with its schedule day if given"""
     quote = quote_data["quote"]
     author = quote_data["author"]
     
     print("\n✨ TODAY'S QUOTE ✨")
+    if day is not None:
+        print(f"  {day.strftime('%A, %B %d, %Y')}")
     print("-" * 40)
     
     # Format long quotes with word wrapping
@@ -173,9 +214,9 @@ def main():
         choice = display_menu()
         
         if choice == 1:
-            # Get today's quote
-            quote = get_daily_quote()
-            display_quote(quote)
+            # Get today's quote from the daily schedule
+            day, quote = get_scheduled_quote()
+            display_quote(quote, day)
             
             # Ask if user wants to save it
             save_option = input("Save this quote to your journal? (y/n): ").strip().lower()
@@ -188,7 +229,7 @@ def main():
         elif choice == 2:
             # Get a random quote (not based on date)
             random.seed()  # Reset seed to current time
-            quote = random.choice(QUOTES)
+            quote = random.choice(get_quotes())
             display_quote(quote)
             
             # Ask if user wants to save it
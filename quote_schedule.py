@@ -0,0 +1,140 @@
+"""Quote file and daily quote schedule shared by the CLI and the GUI"""
+import random
+import datetime
+import json
+import os
+import tempfile
+
+# Quote file written by the GUI and read by both programs
+QUOTES_FILE = "quotes.json"
+
+# Daily quote schedule, planned ahead and kept stable across quote edits
+SCHEDULE_FILE = "quote_schedule.json"
+SCHEDULE_VERSION = 1
+SCHEDULE_DAYS = 365
+
+def get_mtime(filename):
+    """Return the modification time of a file, or None if it is missing"""
+    try:
+        return os.path.getmtime(filename)
+    except OSError:
+        return None
+
+def is_valid_quote(quote):
+    """Return True if quote is a dict with a quote, an author and an optional category"""
+    return (isinstance(quote, dict)
+            and isinstance(quote.get("quote"), str)
+            and isinstance(quote.get("author"), str)
+            and isinstance(quote.get("category", ""), str))
+
+def is_valid_quotes(quotes):
+    """Return True if quotes is a non-empty list of quote dicts"""
+    if not isinstance(quotes, list) or not quotes:
+        return False
+    return all(is_valid_quote(q) for q in quotes)
+
+def read_quotes(filename=QUOTES_FILE):
+    """Return the quotes in a quote file, or None if it is missing or malformed"""
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            quotes = json.load(file)
+    except Exception:
+        return None
+    return quotes if is_valid_quotes(quotes) else None
+
+class QuoteSchedule:
+    """
+    Maps each day to the text of its quote, SCHEDULE_DAYS ahead.
+    The schedule file is shared by every running program: it is re-read
+    whenever it changes on disk, and merged with the file before saving.
+    """
+
+    def __init__(self, filename=SCHEDULE_FILE, on_error=print):
+        self.filename = filename
+        self.on_error = on_error
+        self.days = self.load()
+        self.mtime = get_mtime(filename)
+        self.planned_on = None
+        self.planned_with = None
+
+    def load(self):
+        """Load the scheduled days, starting over if the file is unknown or malformed"""
+        try:
+            with open(self.filename, "r", encoding="utf-8") as file:
+                schedule = json.load(file)
+            if (isinstance(schedule, dict)
+                    and schedule.get("version") == SCHEDULE_VERSION
+                    and isinstance(schedule.get("days"), dict)):
+                return schedule["days"]
+        except Exception:
+            pass
+        return {}
+
+    def reload_if_changed(self):
+        """Reload the schedule when another program has saved it"""
+        mtime = get_mtime(self.filename)
+        if mtime == self.mtime:
+            return
+
+        self.days = self.load()
+        self.mtime = mtime
+        self.planned_on = None  # Check the loaded days against our quotes
+
+    def plan(self, quotes_by_text, start):
+        """
+        Assign a quote to every day from start to SCHEDULE_DAYS ahead.
+        Days already assigned to a quote that still exists keep it, so only
+        days whose quote was removed (or new days) are re-planned. Past days
+        are never touched. Returns True if the schedule changed.
+        """
+        # Sort so the pick for a day does not depend on the order of the quotes
+        texts = sorted(quotes_by_text)
+        changed = False
+
+        for offset in range(SCHEDULE_DAYS):
+            day = start + datetime.timedelta(days=offset)
+            key = day.isoformat()
+            if self.days.get(key) in quotes_by_text:
+                continue
+            self.days[key] = random.Random(day.toordinal()).choice(texts)
+            changed = True
+
+        return changed
+
+    def save(self, quotes_by_text):
+        """
+        Save the schedule. The file is re-read first, and any day it assigns
+        to a quote that still exists keeps that quote, so a stale copy never
+        overwrites what another program planned. The file is replaced in one
+        step so readers never see it half-written.
+        """
+        for day, text in self.load().items():
+            if text in quotes_by_text:
+                self.days[day] = text
+
+        # Each writer gets its own temporary file next to the schedule
+        directory, name = os.path.split(os.path.abspath(self.filename))
+        temp_file = None
+        try:
+            fd, temp_file = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"version": SCHEDULE_VERSION, "days": self.days}, file, indent=2)
+            os.replace(temp_file, self.filename)
+            self.mtime = get_mtime(self.filename)
+        except Exception as e:
+            if temp_file is not None and os.path.exists(temp_file):
+                os.remove(temp_file)
+            self.on_error(f"Could not save quote schedule: {e}")
+
+    def get_text(self, quotes_by_text, day):
+        """Return the text of the quote scheduled for a day"""
+        self.reload_if_changed()
+
+        # Plan at most once per day or quote change; lookups in between are dict reads
+        if self.planned_on != day or self.planned_with is not quotes_by_text:
+            if self.plan(quotes_by_text, day):
+                self.save(quotes_by_text)
+            self.planned_on = day
+            self.planned_with = quotes_by_text
+
+        return self.days[day.isoformat()]